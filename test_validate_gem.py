@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for validate_gem.py
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import validate_gem
+
+
+class LookupTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        os.mkdir(self.path("d"))
+        open(self.path("f"), "w").close()
+        os.symlink("f", self.path("link_file"))
+        os.symlink("d", self.path("link_dir"))
+        os.symlink("nowhere", self.path("broken"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def lookup(self, name):
+        path = self.path(name)
+        listing = validate_gem.scan_parents((os.path.dirname(path),))
+        return validate_gem.lookup(listing, path)
+
+    def test_matches_exists_and_isdir(self):
+        for name in ("f", "d", "link_file", "link_dir", "broken", "missing"):
+            with self.subTest(name=name):
+                kind = self.lookup(name)
+                self.assertEqual(kind is not None, os.path.exists(self.path(name)))
+                self.assertEqual(kind is True, os.path.isdir(self.path(name)))
+
+    def test_broken_symlink_is_missing(self):
+        self.assertIsNone(self.lookup("broken"))
+
+    def test_symlinks_report_target_type(self):
+        self.assertIs(self.lookup("link_dir"), True)
+        self.assertIs(self.lookup("link_file"), False)
+
+    def test_missing_parent_reports_children_missing(self):
+        self.assertIsNone(self.lookup(os.path.join("absent", "f")))
+
+    def test_missing_parent_needs_no_stat_per_child(self):
+        listing = validate_gem.scan_parents((self.path("absent"), self.path("f")))
+        self.assertEqual(listing, {self.path("absent"): {}, self.path("f"): {}})
+        with mock.patch.object(os, "stat", wraps=os.stat) as st:
+            for name in ("a", "b", "c"):
+                self.assertIsNone(validate_gem.lookup(listing, self.path("absent", name)))
+                self.assertIsNone(validate_gem.lookup(listing, self.path("f", name)))
+        st.assert_not_called()
+
+    @unittest.skipIf(os.name != "posix" or os.geteuid() == 0, "needs unprivileged POSIX user")
+    def test_execute_only_parent_falls_back_to_stat(self):
+        os.mkdir(self.path("x"))
+        open(self.path("x", "f"), "w").close()
+        os.chmod(self.path("x"), 0o111)
+        try:
+            self.assertIs(self.lookup(os.path.join("x", "f")), False)
+        finally:
+            os.chmod(self.path("x"), 0o755)
+
+    def test_unlistable_parent_falls_back_to_stat(self):
+        listing = {self.root: None}
+        self.assertIs(validate_gem.lookup(listing, self.path("d")), True)
+        self.assertIs(validate_gem.lookup(listing, self.path("f")), False)
+        self.assertIsNone(validate_gem.lookup(listing, self.path("missing")))
+
+
+class ReportChecksTest(unittest.TestCase):
+    def report(self, checks, content, *args):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            validate_gem.report_checks(checks, content, *args)
+        return buf.getvalue().splitlines()
+
+    def test_single_needle(self):
+        checks = (("spec.name", "name"), ("spec.license", "MIT"))
+        self.assertEqual(self.report(checks, "spec.name"), ["✅ name", "❌ Missing MIT"])
+
+    def test_tuple_needle_requires_every_member(self):
+        checks = ((("module Foo", "VERSION"), "Version file structure"),)
+        self.assertEqual(
+            self.report(checks, "module Foo\nVERSION = 1", "{} issues"),
+            ["✅ Version file structure"],
+        )
+        self.assertEqual(
+            self.report(checks, "module Foo", "{} issues"),
+            ["❌ Version file structure issues"],
+        )
+        self.assertEqual(
+            self.report(checks, "VERSION"),
+            ["❌ Missing Version file structure"],
+        )
+
+
+class ReadErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        validate_gem.read_text.cache_clear()
+        # A directory passes the presence check but cannot be read as text
+        os.mkdir("rails-route-extractor.gemspec")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        validate_gem.read_text.cache_clear()
+        self.tmp.cleanup()
+
+    def test_error_labels(self):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            validate_gem.main()
+        errors = [line for line in buf.getvalue().splitlines() if "Error reading" in line]
+        labels = [line.split(":")[0] for line in errors]
+        self.assertEqual(labels, [
+            "❌ Error reading gemspec",
+            "❌ Error reading main lib file",
+            "❌ Error reading version file",
+            "❌ Error reading executable",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
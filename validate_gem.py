@@ -4,70 +4,171 @@
 Validate the RailsRouteExtractor gem structure
 """
 
+import io
 import os
+import stat
 import sys
 import json
+from collections import namedtuple
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=None)
+def read_text(path):
+    """Read a file once per run; later checks on the same path reuse the content."""
+    return Path(path).read_text(encoding="utf-8", errors="replace")
+
+def scan_dir(parent):
+    """Return {name: is_dir} for one directory, {} if it is missing, or None if unreadable."""
+    entries = {}
+    try:
+        with os.scandir(parent or ".") as it:
+            for entry in it:
+                if entry.is_symlink():
+                    # Only symlinks need a real stat to learn their target type
+                    try:
+                        st = os.stat(entry.path)
+                    except OSError:
+                        continue
+                    entries[entry.name] = stat.S_ISDIR(st.st_mode)
+                else:
+                    entries[entry.name] = entry.is_dir(follow_symlinks=False)
+    except (FileNotFoundError, NotADirectoryError):
+        # A missing parent means every child is missing too
+        return {}
+    except OSError:
+        return None
+    return entries
+
+def scan_parents(parents):
+    """Map each parent directory to {name: is_dir}, one scandir per parent."""
+    return {parent: scan_dir(parent) for parent in parents}
+
+def lookup(listing, path):
+    """Return True for a directory, False for any other entry, None if missing."""
+    parent, name = os.path.split(path)
+    entries = listing.get(parent)
+    if entries is None:
+        # Parent exists but could not be listed (e.g. execute-only); stat the path itself
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return stat.S_ISDIR(st.st_mode)
+    return entries.get(name)
+
+# Expected file structure
+EXPECTED_FILES = (
+    # Core gem files
+    "rails-route-extractor.gemspec",
+    "lib/rails_route_extractor.rb",
+    "lib/rails_route_extractor/version.rb",
+    "lib/rails_route_extractor/configuration.rb",
+    "lib/rails_route_extractor/route_analyzer.rb",
+    "lib/rails_route_extractor/code_extractor.rb",
+    "lib/rails_route_extractor/dependency_tracker.rb",
+    "lib/rails_route_extractor/gem_analyzer.rb",
+    "lib/rails_route_extractor/file_analyzer.rb",
+    "lib/rails_route_extractor/extract_manager.rb",
+    "lib/rails_route_extractor/cli.rb",
+    "lib/rails_route_extractor/railtie.rb",
+
+    # Executables
+    "exe/rails_route_extractor",
+
+    # Documentation
+    "README.md",
+    "CHANGELOG.md",
+    "LICENSE.txt",
+
+    # Development files
+    "Gemfile",
+    "Rakefile",
+    ".rspec",
+    "bin/test",
+
+    # Spec files
+    "spec/spec_helper.rb",
+    "spec/rails_route_extractor_spec.rb",
+    "spec/rails_route_extractor/configuration_spec.rb",
+    "spec/rails_route_extractor/route_analyzer_spec.rb",
+    "spec/rails_route_extractor/cli_spec.rb",
+    "spec/integration/basic_functionality_spec.rb",
+)
+
+# Expected directories
+EXPECTED_DIRS = (
+    "lib/rails_route_extractor",
+    "lib/rails_route_extractor/generators",
+    "lib/rails_route_extractor/generators/templates",
+    "lib/rails_route_extractor/tasks",
+    "spec/rails_route_extractor",
+    "spec/integration",
+    "examples",
+    "docs",
+    "exe",
+    "bin",
+)
+
+# Parent directories to scan, derived once from the lists above
+SCAN_PARENTS = tuple(sorted({os.path.dirname(p) for p in EXPECTED_FILES + EXPECTED_DIRS}))
+
+# Content checks as (needle, description) pairs; a tuple of needles must all match
+GEMSPEC_CHECKS = (
+    ("spec.name", "rails_route_extractor"),
+    ("RailsRouteExtractor::VERSION", "version reference"),
+    ("spec.summary", "summary"),
+    ("spec.description", "description"),
+    ("spec.homepage", "homepage"),
+    ("spec.license", "MIT"),
+)
+
+LIB_CHECKS = (
+    ("module RailsRouteExtractor", "module definition"),
+    ("require_relative", "require statements"),
+    ("def configure", "configure method"),
+    ("def extract_route", "extract_route method"),
+)
+
+VERSION_CHECKS = (
+    (("module RailsRouteExtractor", "VERSION"), "Version file structure"),
+)
+
+EXE_CHECKS = (
+    ("RailsRouteExtractor::CLI.start", "Executable structure"),
+)
+
+# A content validation; name labels read errors and defaults to heading
+Validation = namedtuple(
+    "Validation", "heading path checks failure name", defaults=("Missing {}", None)
+)
+
+VALIDATIONS = (
+    Validation("gemspec content", "rails-route-extractor.gemspec", GEMSPEC_CHECKS, name="gemspec"),
+    Validation("main lib file", "lib/rails_route_extractor.rb", LIB_CHECKS),
+    Validation("version file", "lib/rails_route_extractor/version.rb", VERSION_CHECKS, "{} issues"),
+    Validation("executable", "exe/rails_route_extractor", EXE_CHECKS, "{} issues"),
+)
+
+def report_checks(checks, content, failure="Missing {}"):
+    """Print a ✅/❌ line per (needle, description) check against content."""
+    for needle, description in checks:
+        needles = (needle,) if isinstance(needle, str) else needle
+        if all(n in content for n in needles):
+            print(f"✅ {description}")
+        else:
+            print("❌ " + failure.format(description))
+
 def main():
     print("RailsRouteExtractor Gem Structure Validation")
     print("=" * 50)
     
-    # Define expected file structure
-    expected_files = [
-        # Core gem files
-        "rails-route-extractor.gemspec",
-        "lib/rails_route_extractor.rb",
-        "lib/rails_route_extractor/version.rb",
-        "lib/rails_route_extractor/configuration.rb",
-        "lib/rails_route_extractor/route_analyzer.rb",
-        "lib/rails_route_extractor/code_extractor.rb",
-        "lib/rails_route_extractor/dependency_tracker.rb",
-        "lib/rails_route_extractor/gem_analyzer.rb",
-        "lib/rails_route_extractor/file_analyzer.rb",
-        "lib/rails_route_extractor/extract_manager.rb",
-        "lib/rails_route_extractor/cli.rb",
-        "lib/rails_route_extractor/railtie.rb",
-        
-        # Executables
-        "exe/rails_route_extractor",
-        
-        # Documentation
-        "README.md",
-        "CHANGELOG.md",
-        "LICENSE.txt",
-        
-        # Development files
-        "Gemfile",
-        "Rakefile",
-        ".rspec",
-        "bin/test",
-        
-        # Spec files
-        "spec/spec_helper.rb",
-        "spec/rails_route_extractor_spec.rb",
-        "spec/rails_route_extractor/configuration_spec.rb",
-        "spec/rails_route_extractor/route_analyzer_spec.rb",
-        "spec/rails_route_extractor/cli_spec.rb",
-        "spec/integration/basic_functionality_spec.rb",
-    ]
-    
-    # Define expected directories
-    expected_dirs = [
-        "lib/rails_route_extractor",
-        "lib/rails_route_extractor/generators",
-        "lib/rails_route_extractor/generators/templates",
-        "lib/rails_route_extractor/tasks",
-        "spec/rails_route_extractor",
-        "spec/integration",
-        "examples",
-        "docs",
-        "exe",
-        "bin",
-    ]
+    # The gemspec sits in the root scan, so this needs no stat of its own
+    listing = scan_parents(SCAN_PARENTS)
     
     # Check if we're in the right directory
-    if not os.path.exists("rails-route-extractor.gemspec"):
+    if lookup(listing, "rails-route-extractor.gemspec") is None:
         print("❌ Error: rails-route-extractor.gemspec not found in current directory")
         print("Please run this script from the gem root directory")
         sys.exit(1)
@@ -76,104 +177,37 @@ def main():
     
     # Validate file structure
     missing_files = []
-    for file_path in expected_files:
-        if not os.path.exists(file_path):
+    for file_path in EXPECTED_FILES:
+        if lookup(listing, file_path) is None:
             missing_files.append(file_path)
         else:
             print(f"✅ {file_path}")
     
     if missing_files:
         print(f"\n❌ Missing files: {len(missing_files)}")
-        for file_path in missing_files:
-            print(f"   - {file_path}")
+        sys.stdout.writelines("   - " + p + "\n" for p in missing_files)
     
     # Validate directory structure
     missing_dirs = []
-    for dir_path in expected_dirs:
-        if not os.path.isdir(dir_path):
+    for dir_path in EXPECTED_DIRS:
+        if lookup(listing, dir_path) is not True:
             missing_dirs.append(dir_path)
         else:
             print(f"✅ {dir_path}/")
     
     if missing_dirs:
         print(f"\n❌ Missing directories: {len(missing_dirs)}")
-        for dir_path in missing_dirs:
-            print(f"   - {dir_path}/")
-    
-    # Validate gemspec content
-    print("\n🔍 Validating gemspec content...")
-    try:
-        with open("rails-route-extractor.gemspec", "r") as f:
-            content = f.read()
-            
-        # Check for key elements
-        checks = [
-            ("spec.name", "rails_route_extractor"),
-            ("RailsRouteExtractor::VERSION", "version reference"),
-            ("spec.summary", "summary"),
-            ("spec.description", "description"),
-            ("spec.homepage", "homepage"),
-            ("spec.license", "MIT"),
-        ]
-        
-        for check, description in checks:
-            if check in content:
-                print(f"✅ {description}")
-            else:
-                print(f"❌ Missing {description}")
-                
-    except Exception as e:
-        print(f"❌ Error reading gemspec: {e}")
-    
-    # Validate main lib file
-    print("\n🔍 Validating main lib file...")
-    try:
-        with open("lib/rails_route_extractor.rb", "r") as f:
-            content = f.read()
-            
-        checks = [
-            ("module RailsRouteExtractor", "module definition"),
-            ("require_relative", "require statements"),
-            ("def configure", "configure method"),
-            ("def extract_route", "extract_route method"),
-        ]
-        
-        for check, description in checks:
-            if check in content:
-                print(f"✅ {description}")
-            else:
-                print(f"❌ Missing {description}")
-                
-    except Exception as e:
-        print(f"❌ Error reading main lib file: {e}")
-    
-    # Validate version file
-    print("\n🔍 Validating version file...")
-    try:
-        with open("lib/rails_route_extractor/version.rb", "r") as f:
-            content = f.read()
-            
-        if "module RailsRouteExtractor" in content and "VERSION" in content:
-            print("✅ Version file structure")
-        else:
-            print("❌ Version file structure issues")
-            
-    except Exception as e:
-        print(f"❌ Error reading version file: {e}")
+        sys.stdout.writelines("   - " + p + "/\n" for p in missing_dirs)
     
-    # Validate executable
-    print("\n🔍 Validating executable...")
-    try:
-        with open("exe/rails_route_extractor", "r") as f:
-            content = f.read()
-            
-        if "RailsRouteExtractor::CLI.start" in content:
-            print("✅ Executable structure")
-        else:
-            print("❌ Executable structure issues")
-            
-    except Exception as e:
-        print(f"❌ Error reading executable: {e}")
+    # Validate file contents
+    for v in VALIDATIONS:
+        print(f"\n🔍 Validating {v.heading}...")
+        try:
+            content = read_text(v.path)
+        except OSError as e:
+            print(f"❌ Error reading {v.name or v.heading}: {e}")
+            continue
+        report_checks(v.checks, content, v.failure)
     
     # Summary
     print("\n" + "=" * 50)
@@ -184,6 +218,17 @@ def main():
     
     print("\nThe RailsRouteExtractor gem structure is valid and ready for packaging.")
 
+def run_buffered(func):
+    """Run func with stdout collected in memory and written out in one call."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            func()
+    finally:
+        # Also runs on sys.exit(), so early failures still show their output
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
 if __name__ == "__main__":
-    main()
+    run_buffered(main)
 